@@ -18,6 +18,8 @@ Usage:
                              (default: ~/secrets/google-oauth/token.json)
         --port PORT          Localhost port for OAuth redirect
                              (default: 8080)
+        --force              Run the browser consent flow even if the
+                             existing token can still be refreshed
 
 See docs/google-oauth-setup.md for the full setup guide.
 """
@@ -29,6 +31,9 @@ import stat
 import sys
 
 try:
+    from google.auth.exceptions import RefreshError, TransportError
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
 except ImportError:
     print("Error: google-auth-oauthlib is not installed.")
@@ -67,9 +72,63 @@ def parse_args():
         default=DEFAULT_PORT,
         help=f"Localhost port for OAuth redirect (default: {DEFAULT_PORT})",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run the consent flow even if the existing token is still usable",
+    )
     return parser.parse_args()
 
 
+def load_existing_credentials(token_path):
+    """Return the stored credentials if they can still be used, else None.
+
+    The stored refresh token is always exercised against Google: token files
+    written by gcal-sdk carry no expiry, so they look valid locally even
+    after the grant has been revoked or has lapsed.
+    """
+    if not os.path.isfile(token_path):
+        return None
+
+    try:
+        credentials = Credentials.from_authorized_user_file(token_path, SCOPES)
+    except (OSError, ValueError) as exc:
+        print(f"Existing token could not be read: {exc}")
+        return None
+
+    if not credentials.refresh_token:
+        return None
+
+    try:
+        credentials.refresh(Request())
+    except (RefreshError, TransportError) as exc:
+        print(f"Existing token could not be refreshed: {exc}")
+        return None
+
+    return credentials
+
+
+def save_token(credentials, token_path):
+    """Write credentials to token_path with owner-only permissions."""
+    token_data = {
+        "token": credentials.token,
+        "refresh_token": credentials.refresh_token,
+        "token_uri": credentials.token_uri,
+        "client_id": credentials.client_id,
+        "client_secret": credentials.client_secret,
+        "scopes": list(credentials.scopes),
+    }
+
+    if credentials.expiry:
+        token_data["expiry"] = credentials.expiry.isoformat() + "Z"
+
+    with open(token_path, "w") as f:
+        json.dump(token_data, f, indent=2)
+
+    # Set restrictive permissions (owner read/write only)
+    os.chmod(token_path, stat.S_IRUSR | stat.S_IWUSR)  # 600
+
+
 def main():
     args = parse_args()
 
@@ -91,6 +150,15 @@ def main():
     if token_dir:
         os.makedirs(token_dir, mode=0o700, exist_ok=True)
 
+    # --- Reuse the existing token if it still works ---
+    if not args.force:
+        credentials = load_existing_credentials(token_path)
+        if credentials is not None:
+            save_token(credentials, token_path)
+            print(f"Existing token at {token_path} is still valid.")
+            print("No browser sign-in needed. Use --force to re-authorize anyway.")
+            return
+
     # --- Check for existing token ---
     if os.path.isfile(token_path):
         print(f"Token file already exists at: {token_path}")
@@ -134,23 +202,7 @@ def main():
         sys.exit(1)
 
     # --- Save token to disk ---
-    token_data = {
-        "token": credentials.token,
-        "refresh_token": credentials.refresh_token,
-        "token_uri": credentials.token_uri,
-        "client_id": credentials.client_id,
-        "client_secret": credentials.client_secret,
-        "scopes": list(credentials.scopes),
-    }
-
-    if credentials.expiry:
-        token_data["expiry"] = credentials.expiry.isoformat() + "Z"
-
-    with open(token_path, "w") as f:
-        json.dump(token_data, f, indent=2)
-
-    # Set restrictive permissions (owner read/write only)
-    os.chmod(token_path, stat.S_IRUSR | stat.S_IWUSR)  # 600
+    save_token(credentials, token_path)
 
     print()
     print(f"Token saved to: {token_path}")
@@ -2,12 +2,34 @@
 
 from __future__ import annotations
 
-import json
+import functools
+import inspect
+import logging
+import os
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable
 
+import orjson
 from mcp.server.fastmcp import FastMCP
 from gcal_sdk import GCalClient
+from pydantic import BaseModel
+
+
+def _fromisoformat(value: str) -> datetime:
+    """datetime.fromisoformat that also accepts a trailing "Z" on Python 3.10."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # optional speedup, see the "fast" extra
+    _parse_iso = _fromisoformat
+
+logger = logging.getLogger(__name__)
 
 mcp = FastMCP("calendar")
 
@@ -16,16 +38,21 @@ mcp = FastMCP("calendar")
 # ---------------------------------------------------------------------------
 
 _client: GCalClient | None = None
+_client_lock = threading.Lock()
 
 
 def get_client() -> GCalClient:
     """Return the shared GCalClient, creating it on first call.
 
     The client loads credentials from ~/secrets/google-oauth/ by default.
+    Construction is guarded by a lock so concurrent first calls don't each
+    load credentials and refresh the OAuth token.
     """
     global _client
     if _client is None:
-        _client = GCalClient()
+        with _client_lock:
+            if _client is None:
+                _client = GCalClient()
     return _client
 
 
@@ -33,31 +60,60 @@ def get_client() -> GCalClient:
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Responses are compact JSON -- every byte is an LLM token. Set
+# GCAL_MCP_PRETTY=1 to indent them for human reading.
+# Datetimes are encoded natively as RFC 3339 with a "Z" suffix for UTC, the
+# same form the Calendar API itself returns.
+_PRETTY = os.environ.get("GCAL_MCP_PRETTY") == "1"
+_JSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_NAIVE_UTC
+    | orjson.OPT_UTC_Z
+    | (orjson.OPT_INDENT_2 if _PRETTY else 0)
+)
+
 
 def _parse_json(value: str | dict | list | None, name: str) -> Any:
     """Parse a JSON string into a Python object, or pass through if already parsed."""
     if value is None:
         return None
-    if isinstance(value, (dict, list)):
+    value_type = type(value)
+    if value_type is dict or value_type is list:
         return value
     try:
-        return json.loads(value)
-    except json.JSONDecodeError as exc:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError as exc:
         raise ValueError(f"Invalid JSON for parameter '{name}': {exc}") from exc
 
 
+def _parse_id_list(value: str | list, name: str) -> list[str]:
+    """Parse a JSON array of ID strings, rejecting any other JSON value."""
+    ids = _parse_json(value, name)
+    if not isinstance(ids, list) or not all(isinstance(item, str) for item in ids):
+        raise ValueError(f"{name} must be a JSON array of ID strings")
+    return ids
+
+
 def _error_response(exc: Exception) -> str:
     """Format an exception into a user-friendly error string."""
-    return json.dumps({"error": True, "message": str(exc)}, indent=2)
+    return orjson.dumps({"error": True, "message": str(exc)}, option=_JSON_OPTIONS).decode()
 
 
+@functools.lru_cache(maxsize=1024)
 def _parse_datetime(value: str | None, *, required: bool = False) -> datetime | None:
-    """Parse an ISO 8601 datetime string, assuming UTC if no timezone."""
+    """Parse an ISO 8601 datetime string, assuming UTC if no timezone.
+
+    Cached because clients tend to replay the same time_min/time_max across
+    list_events, list_event_instances and query_freebusy calls.
+    """
     if value is None:
         if required:
             raise ValueError("datetime value is required")
         return None
-    dt = datetime.fromisoformat(value)
+    try:
+        dt = _parse_iso(value)
+    except ValueError:
+        dt = _fromisoformat(value)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     return dt
@@ -67,56 +123,221 @@ def _parse_datetime(value: str | None, *, required: bool = False) -> datetime |
 # Response slimming -- strip Calendar API noise to reduce token usage
 # ---------------------------------------------------------------------------
 
-# Keys that are always API machinery noise
-_ALWAYS_STRIP_KEYS = {"etag", "kind", "conferenceProperties"}
+# Keys that are always API machinery noise (iCalUID is redundant with id)
+_ALWAYS_STRIP_KEYS = frozenset({"etag", "kind", "conferenceProperties", "iCalUID"})
+
+# Reminder payloads that just mean "use the calendar default"
+_DEFAULT_REMINDERS = ({"useDefault": True}, {"use_default": True})
+
+# Keys that are only noise for particular values, mapped to that test
+_CONDITIONAL_STRIP: dict[str, Callable[[Any], bool]] = {
+    "reminders": lambda value: value in _DEFAULT_REMINDERS,
+    "sequence": lambda value: value == 0,
+}
 
 
 def _slim_response(data: Any) -> Any:
-    """Recursively strip metadata noise from a Google Calendar API response.
+    """Strip metadata noise from a Google Calendar API response.
 
     Removes null values, empty strings, empty lists, redundant keys, and
     other noise that inflates token usage without adding information value.
+    Walks the payload with an explicit stack rather than recursion.
+
+    Dispatch is on exact type: payloads come from model_dump or the tools
+    themselves, so containers are always plain dict/list and identity checks
+    are cheaper than isinstance on every leaf.
+    """
+    kind = type(data)
+    if kind is dict:
+        root: Any = {}
+    elif kind is list:
+        root = []
+    else:
+        return data
+
+    child: Any
+    stack: list[tuple[Any, Any]] = [(data, root)]
+    while stack:
+        source, target = stack.pop()
+        if type(source) is dict:
+            for key, value in source.items():
+                if value is None or key in _ALWAYS_STRIP_KEYS:
+                    continue
+                kind = type(value)
+                if (kind is str or kind is list) and not value:
+                    continue
+                check = _CONDITIONAL_STRIP.get(key)
+                if check is not None and check(value):
+                    continue
+                if kind is dict:
+                    target[key] = child = {}
+                    stack.append((value, child))
+                elif kind is list:
+                    target[key] = child = []
+                    stack.append((value, child))
+                else:
+                    target[key] = value
+        else:
+            for item in source:
+                kind = type(item)
+                if kind is dict:
+                    child = {}
+                elif kind is list:
+                    child = []
+                else:
+                    target.append(item)
+                    continue
+                target.append(child)
+                stack.append((item, child))
+
+    return root
+
+
+# model_dump options shared by every tool -- pydantic-core drops null and
+# default-valued fields before _slim_response ever sees them. That covers
+# every unset Event/Calendar field plus Calendar.primary=False and empty
+# CalendarFreeBusy.busy lists. The SDK defaults sequence and reminders to
+# None, so sequence=0 and default reminders are still stripped by
+# _slim_response.
+_DUMP_OPTIONS: dict[str, Any] = {"by_alias": True, "exclude_none": True, "exclude_defaults": True}
+
+
+@functools.lru_cache(maxsize=None)
+def _excluded_fields(model: type[BaseModel]) -> frozenset[str]:
+    """Return the model's fields whose API key is always stripped (e.g. Event.ical_uid)."""
+    return frozenset(
+        name
+        for name, field in model.model_fields.items()
+        if (field.alias or name) in _ALWAYS_STRIP_KEYS
+    )
+
+
+def _dump(data: Any) -> Any:
+    """Dump an SDK model with the shared options; pass anything else through.
+
+    Each model's always-stripped fields are excluded during the dump itself,
+    so they are never copied into the dict _slim_response has to walk.
+    """
+    if isinstance(data, BaseModel):
+        return data.model_dump(exclude=_excluded_fields(type(data)), **_DUMP_OPTIONS)
+    return data
+
+
+def _json_array(parts: list[str]) -> str:
+    """Join separately encoded JSON values into one array.
+
+    In pretty mode each element is re-indented one level, so the result
+    matches what orjson would emit for the whole list.
+    """
+    if not _PRETTY:
+        return "[" + ",".join(parts) + "]"
+    if not parts:
+        return "[]"
+    # orjson escapes newlines inside strings, so every raw newline is layout
+    return "[\n  " + ",\n  ".join(part.replace("\n", "\n  ") for part in parts) + "\n]"
+
+
+def _to_json(data: Any) -> str:
+    """Slim a response payload and serialize it to a JSON string.
+
+    Lists are dumped, slimmed, and encoded one element at a time, so a long
+    list of SDK models never has more than one element's intermediate dict
+    alive at once.
     """
     if isinstance(data, list):
-        return [_slim_response(item) for item in data]
+        return _json_array([
+            orjson.dumps(_slim_response(_dump(item)), option=_JSON_OPTIONS).decode() for item in data
+        ])
+    return orjson.dumps(_slim_response(_dump(data)), option=_JSON_OPTIONS).decode()
 
-    if not isinstance(data, dict):
-        return data
 
-    result: dict[str, Any] = {}
+# ---------------------------------------------------------------------------
+# Response cache -- serialized responses keyed by resource etag
+# ---------------------------------------------------------------------------
+
+class _EncodedJSON:
+    """A response that is already serialized; tool_response returns its text as-is.
+
+    A wrapper rather than a str subclass, so cached text is handed out
+    without copying and callers still receive a plain str.
+    """
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str) -> None:
+        self.text = text
 
-    for key, value in data.items():
-        # --- Strip null values ---
-        if value is None:
-            continue
 
-        # --- Strip empty strings and empty lists ---
-        if value == "" or value == []:
-            continue
+_RESPONSE_CACHE_SIZE = 1024
+_response_cache: OrderedDict[tuple, _EncodedJSON] = OrderedDict()
+_response_cache_lock = threading.Lock()
 
-        # --- Strip keys that are always API noise ---
-        if key in _ALWAYS_STRIP_KEYS:
-            continue
 
-        # --- Strip iCalUID (redundant with id) ---
-        if key == "iCalUID":
-            continue
+def _cached_json(key: tuple, data: Any) -> _EncodedJSON:
+    """Return the serialized form of data, reusing an earlier encoding of key.
 
-        # --- Strip reminders when just default ---
-        if key == "reminders" and isinstance(value, dict):
-            if value == {"useDefault": True} or value == {"use_default": True}:
-                continue
+    Keys must include the resource's etag, which Google changes whenever the
+    resource changes, so a cache hit is never stale. The cache keeps the
+    most recently used _RESPONSE_CACHE_SIZE entries.
+    """
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+        if cached is not None:
+            _response_cache.move_to_end(key)
+            return cached
+
+    encoded = _EncodedJSON(_to_json(data))
+    with _response_cache_lock:
+        _response_cache[key] = encoded
+        if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+    return encoded
+
+
+def tool_response(fn: Callable[..., Any]) -> Callable[..., str]:
+    """Turn a tool body that returns plain data into one that returns JSON.
+
+    The wrapped body returns SDK models, lists of them, or plain dicts; this
+    wrapper dumps, slims and serializes the result, and formats any exception
+    as an error response. Apply it beneath @mcp.tool() so FastMCP still sees the
+    original parameters and a ``str`` return type.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> str:
+        try:
+            result = fn(*args, **kwargs)
+            if isinstance(result, _EncodedJSON):
+                return result.text
+            return _to_json(result)
+        except Exception as exc:
+            return _error_response(exc)
 
-        # --- Strip sequence when 0 ---
-        if key == "sequence" and value == 0:
-            continue
+    wrapper.__signature__ = inspect.signature(fn, eval_str=True).replace(return_annotation=str)  # type: ignore[attr-defined]
+    return wrapper
 
-        # --- Recurse into nested structures ---
-        value = _slim_response(value)
 
-        result[key] = value
+# ---------------------------------------------------------------------------
+# Batch requests -- several API calls in one HTTP round trip
+# ---------------------------------------------------------------------------
+
+# Google Calendar accepts at most 50 calls per batch request
+_BATCH_LIMIT = 50
 
-    return result
+_BatchCallback = Callable[[str, Any, Exception | None], None]
+
+
+def _execute_batched(service: Any, requests: list[tuple[str, Any]], callback: _BatchCallback) -> None:
+    """Send (request_id, request) pairs as batch requests of at most _BATCH_LIMIT calls.
+
+    callback receives each call's request_id with either its response or
+    the exception it raised.
+    """
+    for offset in range(0, len(requests), _BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=callback)
+        for request_id, request in requests[offset:offset + _BATCH_LIMIT]:
+            batch.add(request, request_id=request_id)
+        batch.execute()
 
 
 # ---------------------------------------------------------------------------
@@ -130,4 +351,10 @@ register_all_tools()
 
 def main() -> None:
     """Entry point for the console script."""
+    # Load credentials up front so the first tool call doesn't pay for it.
+    # A failure here is reported again by whichever tool needs the client.
+    try:
+        get_client()
+    except Exception as exc:
+        logger.warning("Could not initialize Google Calendar client: %s", exc)
     mcp.run()
@@ -4,7 +4,13 @@ from __future__ import annotations
 
 
 def register_all_tools() -> None:
-    """Import all tool modules, which register tools via the module-level @mcp.tool() decorators."""
+    """Import all tool modules, which register tools via the module-level @mcp.tool() decorators.
+
+    The imports must stay serial: this runs while gcal_mcp.server is still
+    being imported, and each tool module imports from it. Importing them from
+    worker threads blocks on server's import lock, which the main thread
+    holds while waiting for the workers -- a deadlock.
+    """
     from . import events  # noqa: F401
     from . import calendars  # noqa: F401
     from . import freebusy  # noqa: F401
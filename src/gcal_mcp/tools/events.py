@@ -2,15 +2,52 @@
 
 from __future__ import annotations
 
-import json
 from typing import Annotated, Any
 
+from gcal_sdk.models import Event
 from pydantic import Field
 
-from ..server import mcp, get_client, _parse_json, _error_response, _slim_response, _parse_datetime
+from ..server import (
+    mcp,
+    get_client,
+    tool_response,
+    _RESPONSE_CACHE_SIZE,
+    _EncodedJSON,
+    _cached_json,
+    _dump,
+    _execute_batched,
+    _json_array,
+    _parse_id_list,
+    _parse_json,
+    _parse_datetime,
+    _to_json,
+)
+
+
+# Listings longer than this would evict most of the shared response cache,
+# including other listings, before any entry could be reused
+_CACHED_LISTING_LIMIT = _RESPONSE_CACHE_SIZE // 4
+
+
+def _encode_events(calendar_id: str, events: list[Event]) -> _EncodedJSON:
+    """Encode a list of events, reusing cached encodings of unchanged ones.
+
+    Uses the same cache keys as get_event, so polling a calendar only
+    re-encodes events whose etag has moved since the last listing or fetch.
+    Listings over _CACHED_LISTING_LIMIT are encoded directly.
+    """
+    if len(events) > _CACHED_LISTING_LIMIT:
+        return _EncodedJSON(_to_json(events))
+    parts = [
+        _to_json(event) if event.id is None or event.etag is None
+        else _cached_json(("event", calendar_id, event.id, event.etag), event).text
+        for event in events
+    ]
+    return _EncodedJSON(_json_array(parts))
 
 
 @mcp.tool()
+@tool_response
 def list_events(
     calendar_id: Annotated[str, Field(description="Calendar ID. Use 'primary' for the user's main calendar.")] = "primary",
     time_min: Annotated[str | None, Field(description="Start of time range (RFC3339, e.g. '2024-01-01T00:00:00Z')")] = None,
@@ -21,50 +58,93 @@ def list_events(
     order_by: Annotated[str | None, Field(description="Sort order: 'startTime' or 'updated'")] = "startTime",
     show_deleted: Annotated[bool, Field(description="Whether to include deleted events (status='cancelled')")] = False,
     page_token: Annotated[str | None, Field(description="Token for fetching the next page of results")] = None,
-) -> str:
+) -> Any:
     """List events from a Google Calendar.
 
     Returns events matching the specified criteria. Use time_min/time_max to
     filter by date range, and q for free-text search.
     """
-    try:
-        client = get_client()
-        events = client.events.list(
-            calendar_id,
-            time_min=_parse_datetime(time_min),
-            time_max=_parse_datetime(time_max),
-            max_results=max_results,
-            q=q,
-            single_events=single_events,
-            order_by=order_by,
-            show_deleted=show_deleted,
-            page_token=page_token,
-        )
-        data = [e.model_dump(by_alias=True) for e in events]
-        return json.dumps(_slim_response(data), indent=2, default=str)
-    except Exception as exc:
-        return _error_response(exc)
+    client = get_client()
+    events = client.events.list(
+        calendar_id,
+        time_min=_parse_datetime(time_min),
+        time_max=_parse_datetime(time_max),
+        max_results=max_results,
+        q=q,
+        single_events=single_events,
+        order_by=order_by,
+        show_deleted=show_deleted,
+        page_token=page_token,
+    )
+    return _encode_events(calendar_id, events)
+
+
+@mcp.tool()
+@tool_response
+def list_events_batch(
+    calendar_ids: Annotated[str | list, Field(description="Calendar IDs as JSON array of strings, e.g. '[\"primary\", \"other@example.com\"]'")],
+    time_min: Annotated[str | None, Field(description="Start of time range (RFC3339, e.g. '2024-01-01T00:00:00Z')")] = None,
+    time_max: Annotated[str | None, Field(description="End of time range (RFC3339, e.g. '2024-12-31T23:59:59Z')")] = None,
+    max_results: Annotated[int, Field(description="Max events to return per calendar")] = 25,
+    q: Annotated[str | None, Field(description="Free-text search query")] = None,
+    single_events: Annotated[bool, Field(description="Expand recurring events into instances")] = True,
+    order_by: Annotated[str | None, Field(description="Sort order: 'startTime' or 'updated'")] = "startTime",
+) -> Any:
+    """List events from several calendars in one batched request.
+
+    Returns an object keyed by calendar ID; calendars with no matching events
+    are omitted. A calendar that fails is reported with an error message
+    instead of failing the whole call.
+    """
+    parsed_ids = list(dict.fromkeys(_parse_id_list(calendar_ids, "calendar_ids")))
+
+    # Same query for every calendar; mirrors EventsResource.list's parameters
+    start = _parse_datetime(time_min)
+    end = _parse_datetime(time_max)
+    query: dict[str, Any] = {"maxResults": max_results, "singleEvents": single_events, "showDeleted": False}
+    if start is not None:
+        query["timeMin"] = start.isoformat()
+    if end is not None:
+        query["timeMax"] = end.isoformat()
+    if order_by is not None:
+        query["orderBy"] = order_by
+    if q is not None:
+        query["q"] = q
+
+    client = get_client()
+    results: dict[str, Any] = {}
+
+    def collect(request_id: str, response: dict, exception: Exception | None) -> None:
+        if exception is not None:
+            results[request_id] = {"error": True, "message": str(exception)}
+            return
+        results[request_id] = [_dump(Event.from_api_response(item)) for item in response.get("items", [])]
+
+    service = client.service
+    requests = [(cal_id, service.events().list(calendarId=cal_id, **query)) for cal_id in parsed_ids]
+    _execute_batched(service, requests, collect)
+    return {cal_id: results.get(cal_id) for cal_id in parsed_ids}
 
 
 @mcp.tool()
+@tool_response
 def get_event(
     calendar_id: Annotated[str, Field(description="Calendar ID. Use 'primary' for the user's main calendar.")],
     event_id: Annotated[str, Field(description="The event ID to retrieve")],
-) -> str:
+) -> Any:
     """Get a single event by its ID.
 
     Returns the full event details for the specified event.
     """
-    try:
-        client = get_client()
-        event = client.events.get(calendar_id, event_id)
-        data = event.model_dump(by_alias=True)
-        return json.dumps(_slim_response(data), indent=2, default=str)
-    except Exception as exc:
-        return _error_response(exc)
+    client = get_client()
+    event = client.events.get(calendar_id, event_id)
+    if event.etag is None:
+        return event
+    return _cached_json(("event", calendar_id, event_id, event.etag), event)
 
 
 @mcp.tool()
+@tool_response
 def create_event(
     summary: Annotated[str, Field(description="Event title/summary")],
     start: Annotated[str, Field(description="Start time (ISO 8601, e.g. '2024-06-15T10:00:00-06:00')")],
@@ -75,54 +155,46 @@ def create_event(
     attendees: Annotated[str | list | None, Field(description="Attendees as JSON array of email strings or attendee objects")] = None,
     time_zone: Annotated[str | None, Field(description="Time zone (e.g. 'America/Denver')")] = None,
     recurrence: Annotated[str | list | None, Field(description="Recurrence rules as JSON array of RRULE strings, e.g. [\"RRULE:FREQ=WEEKLY;COUNT=10\"]")] = None,
-) -> str:
+) -> Any:
     """Create a new event on a Google Calendar.
 
     Creates an event with the specified details. Start and end times must be
     provided as ISO 8601 datetime strings with timezone information.
     """
-    try:
-        client = get_client()
-        parsed_attendees = _parse_json(attendees, "attendees") if attendees is not None else None
-        parsed_recurrence = _parse_json(recurrence, "recurrence") if recurrence is not None else None
-        event = client.events.create(
-            calendar_id,
-            summary=summary,
-            description=description,
-            location=location,
-            start=_parse_datetime(start),
-            end=_parse_datetime(end),
-            attendees=parsed_attendees,
-            time_zone=time_zone,
-            recurrence=parsed_recurrence,
-        )
-        data = event.model_dump(by_alias=True)
-        return json.dumps(_slim_response(data), indent=2, default=str)
-    except Exception as exc:
-        return _error_response(exc)
+    client = get_client()
+    parsed_attendees = _parse_json(attendees, "attendees") if attendees is not None else None
+    parsed_recurrence = _parse_json(recurrence, "recurrence") if recurrence is not None else None
+    return client.events.create(
+        calendar_id,
+        summary=summary,
+        description=description,
+        location=location,
+        start=_parse_datetime(start),
+        end=_parse_datetime(end),
+        attendees=parsed_attendees,
+        time_zone=time_zone,
+        recurrence=parsed_recurrence,
+    )
 
 
 @mcp.tool()
+@tool_response
 def update_event(
     calendar_id: Annotated[str, Field(description="Calendar ID. Use 'primary' for the user's main calendar.")],
     event_id: Annotated[str, Field(description="The event ID to update")],
     body: Annotated[str | dict, Field(description="Complete event body as JSON string or object (full PUT replacement)")],
-) -> str:
+) -> Any:
     """Full update (PUT) of an event -- replaces the entire event resource.
 
     The body must contain the complete event data. Use patch_event for partial updates.
     """
-    try:
-        client = get_client()
-        parsed_body = _parse_json(body, "body")
-        event = client.events.update(calendar_id, event_id, body=parsed_body)
-        data = event.model_dump(by_alias=True)
-        return json.dumps(_slim_response(data), indent=2, default=str)
-    except Exception as exc:
-        return _error_response(exc)
+    client = get_client()
+    parsed_body = _parse_json(body, "body")
+    return client.events.update(calendar_id, event_id, body=parsed_body)
 
 
 @mcp.tool()
+@tool_response
 def patch_event(
     calendar_id: Annotated[str, Field(description="Calendar ID. Use 'primary' for the user's main calendar.")],
     event_id: Annotated[str, Field(description="The event ID to patch")],
@@ -134,93 +206,79 @@ def patch_event(
     attendees: Annotated[str | list | None, Field(description="New attendees as JSON array of email strings or attendee objects")] = None,
     time_zone: Annotated[str | None, Field(description="Time zone (e.g. 'America/Denver')")] = None,
     recurrence: Annotated[str | list | None, Field(description="Recurrence rules as JSON array of RRULE strings, e.g. [\"RRULE:FREQ=WEEKLY;COUNT=10\"]")] = None,
-) -> str:
+) -> Any:
     """Partial update (PATCH) of an event -- only updates specified fields.
 
     Only the provided fields will be changed; all other fields remain unchanged.
     """
-    try:
-        client = get_client()
-        parsed_attendees = _parse_json(attendees, "attendees") if attendees is not None else None
-        parsed_recurrence = _parse_json(recurrence, "recurrence") if recurrence is not None else None
-        event = client.events.patch(
-            calendar_id,
-            event_id,
-            summary=summary,
-            description=description,
-            location=location,
-            start=_parse_datetime(start),
-            end=_parse_datetime(end),
-            attendees=parsed_attendees,
-            time_zone=time_zone,
-            recurrence=parsed_recurrence,
-        )
-        data = event.model_dump(by_alias=True)
-        return json.dumps(_slim_response(data), indent=2, default=str)
-    except Exception as exc:
-        return _error_response(exc)
+    client = get_client()
+    parsed_attendees = _parse_json(attendees, "attendees") if attendees is not None else None
+    parsed_recurrence = _parse_json(recurrence, "recurrence") if recurrence is not None else None
+    return client.events.patch(
+        calendar_id,
+        event_id,
+        summary=summary,
+        description=description,
+        location=location,
+        start=_parse_datetime(start),
+        end=_parse_datetime(end),
+        attendees=parsed_attendees,
+        time_zone=time_zone,
+        recurrence=parsed_recurrence,
+    )
 
 
 @mcp.tool()
+@tool_response
 def delete_event(
     calendar_id: Annotated[str, Field(description="Calendar ID. Use 'primary' for the user's main calendar.")],
     event_id: Annotated[str, Field(description="The event ID to delete")],
     send_updates: Annotated[str | None, Field(description="Notification policy: 'all', 'externalOnly', or 'none'")] = None,
-) -> str:
+) -> Any:
     """Delete an event from a Google Calendar.
 
     Permanently removes the event. Use send_updates to control whether attendees
     are notified about the cancellation.
     """
-    try:
-        client = get_client()
-        client.events.delete(calendar_id, event_id, send_updates=send_updates)
-        return json.dumps({"success": True, "deleted": event_id}, indent=2)
-    except Exception as exc:
-        return _error_response(exc)
+    client = get_client()
+    client.events.delete(calendar_id, event_id, send_updates=send_updates)
+    return {"success": True, "deleted": event_id}
 
 
 @mcp.tool()
+@tool_response
 def move_event(
     calendar_id: Annotated[str, Field(description="Source calendar ID")],
     event_id: Annotated[str, Field(description="The event ID to move")],
     destination_calendar_id: Annotated[str, Field(description="Destination calendar ID")],
-) -> str:
+) -> Any:
     """Move an event from one calendar to another.
 
     Transfers the event to the destination calendar while preserving its data.
     """
-    try:
-        client = get_client()
-        event = client.events.move(calendar_id, event_id, destination_calendar_id)
-        data = event.model_dump(by_alias=True)
-        return json.dumps(_slim_response(data), indent=2, default=str)
-    except Exception as exc:
-        return _error_response(exc)
+    client = get_client()
+    return client.events.move(calendar_id, event_id, destination_calendar_id)
 
 
 @mcp.tool()
+@tool_response
 def list_event_instances(
     calendar_id: Annotated[str, Field(description="Calendar ID. Use 'primary' for the user's main calendar.")],
     event_id: Annotated[str, Field(description="The recurring event ID")],
     time_min: Annotated[str | None, Field(description="Start of time range (RFC3339)")] = None,
     time_max: Annotated[str | None, Field(description="End of time range (RFC3339)")] = None,
     max_results: Annotated[int, Field(description="Max instances to return")] = 25,
-) -> str:
+) -> Any:
     """List instances of a recurring event.
 
     Returns individual occurrences of a recurring event within the specified time range.
     """
-    try:
-        client = get_client()
-        events = client.events.instances(
-            calendar_id,
-            event_id,
-            time_min=_parse_datetime(time_min),
-            time_max=_parse_datetime(time_max),
-            max_results=max_results,
-        )
-        data = [e.model_dump(by_alias=True) for e in events]
-        return json.dumps(_slim_response(data), indent=2, default=str)
-    except Exception as exc:
-        return _error_response(exc)
+    client = get_client()
+    instances = client.events.instances(
+        calendar_id,
+        event_id,
+        time_min=_parse_datetime(time_min),
+        time_max=_parse_datetime(time_max),
+        max_results=max_results,
+    )
+    return _encode_events(calendar_id, instances)
@@ -2,15 +2,64 @@
 
 from __future__ import annotations
 
-import json
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Any
 
+from gcal_sdk.models import FreeBusyResponse
 from pydantic import Field
 
-from ..server import mcp, get_client, _parse_json, _error_response, _slim_response, _parse_datetime
+from ..server import mcp, get_client, tool_response, _execute_batched, _parse_id_list, _parse_datetime
+
+
+# Google's FreeBusy endpoint accepts at most 50 calendars per query
+_QUERY_LIMIT = 50
+
+
+def _query_in_chunks(
+    client: Any,
+    calendar_ids: list[str],
+    time_min: datetime,
+    time_max: datetime,
+    extra: dict[str, Any],
+) -> FreeBusyResponse:
+    """Query more calendars than one FreeBusy call allows via batched requests.
+
+    Each chunk of calendar IDs becomes one freebusy.query call inside a
+    batch request, and the per-chunk calendar maps are merged. A chunk that
+    fails is reported as an error on each of its calendars.
+    """
+    chunks = [calendar_ids[i:i + _QUERY_LIMIT] for i in range(0, len(calendar_ids), _QUERY_LIMIT)]
+    calendars: dict[str, Any] = {}
+
+    def collect(request_id: str, response: dict, exception: Exception | None) -> None:
+        if exception is not None:
+            for cal_id in chunks[int(request_id)]:
+                calendars[cal_id] = {"errors": [{"reason": str(exception)}]}
+        else:
+            calendars.update(response.get("calendars", {}))
+
+    service = client.service
+    requests = [
+        (str(index), service.freebusy().query(body={
+            "timeMin": time_min.isoformat(),
+            "timeMax": time_max.isoformat(),
+            "items": [{"id": cal_id} for cal_id in chunk],
+            **extra,
+        }))
+        for index, chunk in enumerate(chunks)
+    ]
+    _execute_batched(service, requests, collect)
+
+    return FreeBusyResponse.from_api_response({
+        "kind": "calendar#freeBusy",
+        "timeMin": time_min,
+        "timeMax": time_max,
+        "calendars": calendars,
+    })
 
 
 @mcp.tool()
+@tool_response
 def query_freebusy(
     calendar_ids: Annotated[str | list, Field(description="Calendar IDs as JSON array of strings, e.g. '[\"primary\", \"other@example.com\"]'")],
     time_min: Annotated[str, Field(description="Start of time range (RFC3339, e.g. '2024-01-01T00:00:00Z')")],
@@ -18,27 +67,35 @@ def query_freebusy(
     time_zone: Annotated[str | None, Field(description="Time zone (e.g. 'America/Denver')")] = None,
     group_expansion_max: Annotated[int | None, Field(description="Max number of calendars to expand for group members")] = None,
     calendar_expansion_max: Annotated[int | None, Field(description="Max number of calendars to expand for calendar resources")] = None,
-) -> str:
+) -> Any:
     """Query free/busy information for one or more calendars.
 
     Returns busy periods for the specified calendars within the given time range.
-    Useful for finding available meeting times.
+    Useful for finding available meeting times. More than 50 calendars are
+    split across several queries sent in one batched request.
     """
-    try:
-        client = get_client()
-        parsed_ids = _parse_json(calendar_ids, "calendar_ids")
-        kwargs: dict = dict(
-            calendar_ids=parsed_ids,
-            time_min=_parse_datetime(time_min, required=True),
-            time_max=_parse_datetime(time_max, required=True),
-            time_zone=time_zone,
-        )
+    client = get_client()
+    parsed_ids = _parse_id_list(calendar_ids, "calendar_ids")
+    parsed_min = _parse_datetime(time_min, required=True)
+    parsed_max = _parse_datetime(time_max, required=True)
+    if len(parsed_ids) > _QUERY_LIMIT:
+        extra: dict[str, Any] = {}
+        if time_zone is not None:
+            extra["timeZone"] = time_zone
         if group_expansion_max is not None:
-            kwargs["group_expansion_max"] = group_expansion_max
+            extra["groupExpansionMax"] = group_expansion_max
         if calendar_expansion_max is not None:
-            kwargs["calendar_expansion_max"] = calendar_expansion_max
-        response = client.freebusy.query(**kwargs)
-        data = response.model_dump(by_alias=True)
-        return json.dumps(_slim_response(data), indent=2, default=str)
-    except Exception as exc:
-        return _error_response(exc)
+            extra["calendarExpansionMax"] = calendar_expansion_max
+        return _query_in_chunks(client, parsed_ids, parsed_min, parsed_max, extra)
+
+    kwargs: dict = dict(
+        calendar_ids=parsed_ids,
+        time_min=parsed_min,
+        time_max=parsed_max,
+        time_zone=time_zone,
+    )
+    if group_expansion_max is not None:
+        kwargs["group_expansion_max"] = group_expansion_max
+    if calendar_expansion_max is not None:
+        kwargs["calendar_expansion_max"] = calendar_expansion_max
+    return client.freebusy.query(**kwargs)
@@ -2,18 +2,108 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+from gcal_sdk.calendars import CalendarsResource
+from gcal_sdk.events import EventsResource
+from gcal_sdk.freebusy import FreeBusyResource
 
 
-@pytest.fixture(autouse=True)
+def _make_stub_client() -> SimpleNamespace:
+    """Build a GCalClient stand-in whose resource methods are mocks.
+
+    Only the SDK methods the tools call are MagicMocks, so tests keep
+    return_value/side_effect/assert_called_* without MagicMock creating a
+    child mock on every attribute access.
+    """
+    return SimpleNamespace(
+        events=SimpleNamespace(
+            list=MagicMock(), get=MagicMock(), create=MagicMock(), update=MagicMock(),
+            patch=MagicMock(), delete=MagicMock(), move=MagicMock(), instances=MagicMock(),
+        ),
+        calendars=SimpleNamespace(
+            list=MagicMock(), get=MagicMock(), create=MagicMock(), delete=MagicMock(), clear=MagicMock(),
+        ),
+        freebusy=SimpleNamespace(query=MagicMock()),
+        service=MagicMock(),
+    )
+
+
+def _check_stub_client(client: SimpleNamespace) -> None:
+    """Fail fast if a stubbed method no longer exists on the real SDK resource.
+
+    Stands in for autospec's attribute checking, paid once per session.
+    """
+    for resource, spec in (
+        (client.events, EventsResource),
+        (client.calendars, CalendarsResource),
+        (client.freebusy, FreeBusyResource),
+    ):
+        missing = [name for name in vars(resource) if not callable(getattr(spec, name, None))]
+        assert not missing, f"{spec.__name__} has no {missing}"
+
+
+def _reset_stub_client(client: SimpleNamespace) -> None:
+    """Clear recorded calls, return values and side effects on every stub mock."""
+    for resource in (client.events, client.calendars, client.freebusy):
+        for method in vars(resource).values():
+            method.reset_mock(return_value=True, side_effect=True)
+    client.service.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
 def mock_client():
-    """Patch get_client() to return a MagicMock for every test."""
-    client = MagicMock()
-    with patch("gcal_mcp.server._client", None):
-        with patch("gcal_mcp.server.GCalClient", return_value=client):
-            import gcal_mcp.server as srv
-            srv._client = None
-            yield client
-            srv._client = None
+    """Install one stub client as the shared client for the whole session."""
+    client = _make_stub_client()
+    _check_stub_client(client)
+    with patch("gcal_mcp.server._client", client):
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def _fresh_client(mock_client):
+    """Give each test an empty response cache and reset stub mocks afterwards."""
+    with patch.dict("gcal_mcp.server._response_cache", clear=True):
+        yield
+    _reset_stub_client(mock_client)
+
+
+class _FakeBatch:
+    """Stand-in for googleapiclient's BatchHttpRequest that replays canned responses."""
+
+    def __init__(self, responses, callback):
+        self._responses = responses
+        self._callback = callback
+        self.request_ids = []
+
+    def add(self, request, request_id):
+        self.request_ids.append(request_id)
+
+    def execute(self):
+        for request_id in self.request_ids:
+            response = self._responses[request_id]
+            if isinstance(response, Exception):
+                self._callback(request_id, None, response)
+            else:
+                self._callback(request_id, response, None)
+
+
+@pytest.fixture
+def batch_responses(mock_client):
+    """Answer client.service batch requests from a dict of canned responses.
+
+    Tests fill the returned dict with request_id -> response (or exception);
+    the batches created are available as ``mock_client.batches``.
+    """
+    responses: dict = {}
+    mock_client.batches = []
+
+    def new_batch(callback):
+        mock_client.batches.append(_FakeBatch(responses, callback))
+        return mock_client.batches[-1]
+
+    mock_client.service.new_batch_http_request.side_effect = new_batch
+    yield responses
+    del mock_client.batches
@@ -3,31 +3,61 @@
 These tests mock the GCalClient so no real API calls are made.
 """
 
-from __future__ import annotations
+from unittest.mock import call
 
-import json
+import orjson
+import pytest
 
 from gcal_sdk.models import Calendar
 
+from gcal_mcp.server import _JSON_OPTIONS, _json_array
+from gcal_mcp.tools.calendars import (
+    clear_calendar,
+    create_calendar,
+    delete_calendar,
+    get_calendar,
+    list_calendars,
+)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
+# Parsed from an API-shaped payload, the way CalendarsResource builds them
+_BASE_CALENDAR = Calendar.from_api_response({
+    "id": "cal-1",
+    "summary": "My Calendar",
+    "timeZone": "America/Denver",
+    "primary": True,
+    "accessRole": "owner",
+    "etag": '"xyz789"',
+    "kind": "calendar#calendarListEntry",
+})
+
+
 def _make_mock_calendar(**overrides):
-    """Create a mock Calendar with sensible defaults."""
-    defaults = {
-        "id": "cal-1",
-        "summary": "My Calendar",
-        "timeZone": "America/Denver",
-        "primary": True,
-        "accessRole": "owner",
-        "etag": '"xyz789"',
-        "kind": "calendar#calendarListEntry",
-    }
-    defaults.update(overrides)
-    return Calendar.from_api_response(defaults)
+    """Copy _BASE_CALENDAR with overrides by field name; model_copy skips validation."""
+    return _BASE_CALENDAR.model_copy(update=overrides)
+
+
+def _encode(data) -> str:
+    """Encode an expected response with the server's JSON options."""
+    return orjson.dumps(data, option=_JSON_OPTIONS).decode()
+
+
+_EXPECTED_LIST_DEFAULT = call(show_deleted=False, show_hidden=False, max_results=100)
+_EXPECTED_LIST_ALL = call(show_deleted=True, show_hidden=True, max_results=50)
+
+# Exact tool output for the base calendar, encoded the way the server does
+_CALENDAR_JSON = _encode({
+    "id": "cal-1",
+    "summary": "My Calendar",
+    "timeZone": "America/Denver",
+    "primary": True,
+    "accessRole": "owner",
+})
 
 
 # ---------------------------------------------------------------------------
@@ -36,33 +66,22 @@ def _make_mock_calendar(**overrides):
 
 
 class TestListCalendars:
-    def test_list_calendars_default(self, mock_client):
-        from gcal_mcp.tools.calendars import list_calendars
-
+    @pytest.mark.parametrize(
+        "kwargs, expected_call",
+        [
+            ({}, _EXPECTED_LIST_DEFAULT),
+            (dict(show_deleted=True, show_hidden=True, max_results=50), _EXPECTED_LIST_ALL),
+        ],
+        ids=["default", "with-options"],
+    )
+    def test_list_calendars(self, mock_client, kwargs, expected_call):
         mock_client.calendars.list.return_value = [_make_mock_calendar()]
-        result = list_calendars()
-        parsed = json.loads(result)
-        assert isinstance(parsed, list)
-        assert len(parsed) == 1
-        assert parsed[0]["id"] == "cal-1"
-        mock_client.calendars.list.assert_called_once_with(
-            show_deleted=False,
-            show_hidden=False,
-            max_results=100,
-        )
-
-    def test_list_calendars_with_options(self, mock_client):
-        from gcal_mcp.tools.calendars import list_calendars
+        assert list_calendars(**kwargs) == _json_array([_CALENDAR_JSON])
+        assert mock_client.calendars.list.call_args_list == [expected_call]
 
+    def test_list_calendars_empty(self, mock_client):
         mock_client.calendars.list.return_value = []
-        result = list_calendars(show_deleted=True, show_hidden=True, max_results=50)
-        parsed = json.loads(result)
-        assert parsed == []
-        mock_client.calendars.list.assert_called_once_with(
-            show_deleted=True,
-            show_hidden=True,
-            max_results=50,
-        )
+        assert list_calendars() == "[]"
 
 
 # ---------------------------------------------------------------------------
@@ -71,23 +90,21 @@ class TestListCalendars:
 
 
 class TestGetCalendar:
-    def test_get_calendar(self, mock_client):
-        from gcal_mcp.tools.calendars import get_calendar
-
+    @pytest.mark.parametrize("args", [("primary",), ()], ids=["explicit", "default"])
+    def test_get_calendar(self, mock_client, args):
         mock_client.calendars.get.return_value = _make_mock_calendar()
-        result = get_calendar("primary")
-        parsed = json.loads(result)
-        assert parsed["id"] == "cal-1"
+        assert get_calendar(*args) == _CALENDAR_JSON
         mock_client.calendars.get.assert_called_once_with("primary")
 
-    def test_get_calendar_default(self, mock_client):
-        from gcal_mcp.tools.calendars import get_calendar
-
+    def test_get_calendar_reuses_encoding_for_same_etag(self, mock_client):
         mock_client.calendars.get.return_value = _make_mock_calendar()
-        result = get_calendar()
-        parsed = json.loads(result)
-        assert parsed["id"] == "cal-1"
-        mock_client.calendars.get.assert_called_once_with("primary")
+        first = get_calendar("primary")
+        # The stub's summary changed but its etag did not, so the first encoding wins
+        mock_client.calendars.get.return_value = _make_mock_calendar(summary="Ignored")
+        assert get_calendar("primary") is first
+
+        mock_client.calendars.get.return_value = _make_mock_calendar(summary="Renamed", etag='"new"')
+        assert orjson.loads(get_calendar("primary"))["summary"] == "Renamed"
 
 
 # ---------------------------------------------------------------------------
@@ -96,41 +113,38 @@ class TestGetCalendar:
 
 
 class TestCreateCalendar:
-    def test_create_calendar_basic(self, mock_client):
-        from gcal_mcp.tools.calendars import create_calendar
-
+    @pytest.mark.parametrize(
+        "kwargs, expected_call",
+        [
+            (
+                dict(summary="Work"),
+                dict(description=None, time_zone=None, location=None),
+            ),
+            (
+                dict(
+                    summary="Work",
+                    description="Project tracking calendar",
+                    time_zone="America/Denver",
+                    location="Denver, CO",
+                ),
+                dict(
+                    description="Project tracking calendar",
+                    time_zone="America/Denver",
+                    location="Denver, CO",
+                ),
+            ),
+        ],
+        ids=["basic", "full"],
+    )
+    def test_create_calendar(self, mock_client, kwargs, expected_call):
         mock_client.calendars.create.return_value = _make_mock_calendar(
             id="new-cal", summary="Work"
         )
-        result = create_calendar(summary="Work")
-        parsed = json.loads(result)
+        result = create_calendar(**kwargs)
+        parsed = orjson.loads(result)
         assert parsed["id"] == "new-cal"
         assert parsed["summary"] == "Work"
-        mock_client.calendars.create.assert_called_once_with(
-            "Work",
-            description=None,
-            time_zone=None,
-            location=None,
-        )
-
-    def test_create_calendar_full(self, mock_client):
-        from gcal_mcp.tools.calendars import create_calendar
-
-        mock_client.calendars.create.return_value = _make_mock_calendar(id="new-cal")
-        result = create_calendar(
-            summary="Projects",
-            description="Project tracking calendar",
-            time_zone="America/Denver",
-            location="Denver, CO",
-        )
-        parsed = json.loads(result)
-        assert parsed["id"] == "new-cal"
-        mock_client.calendars.create.assert_called_once_with(
-            "Projects",
-            description="Project tracking calendar",
-            time_zone="America/Denver",
-            location="Denver, CO",
-        )
+        mock_client.calendars.create.assert_called_once_with("Work", **expected_call)
 
 
 # ---------------------------------------------------------------------------
@@ -140,13 +154,9 @@ class TestCreateCalendar:
 
 class TestDeleteCalendar:
     def test_delete_calendar(self, mock_client):
-        from gcal_mcp.tools.calendars import delete_calendar
-
         mock_client.calendars.delete.return_value = None
         result = delete_calendar("cal-to-delete")
-        parsed = json.loads(result)
-        assert parsed["success"] is True
-        assert parsed["deleted"] == "cal-to-delete"
+        assert result == _encode({"success": True, "deleted": "cal-to-delete"})
         mock_client.calendars.delete.assert_called_once_with("cal-to-delete")
 
 
@@ -156,23 +166,11 @@ class TestDeleteCalendar:
 
 
 class TestClearCalendar:
-    def test_clear_calendar(self, mock_client):
-        from gcal_mcp.tools.calendars import clear_calendar
-
+    @pytest.mark.parametrize("args", [("primary",), ()], ids=["explicit", "default"])
+    def test_clear_calendar(self, mock_client, args):
         mock_client.calendars.clear.return_value = None
-        result = clear_calendar("primary")
-        parsed = json.loads(result)
-        assert parsed["success"] is True
-        assert parsed["cleared"] == "primary"
-        mock_client.calendars.clear.assert_called_once_with("primary")
-
-    def test_clear_calendar_default(self, mock_client):
-        from gcal_mcp.tools.calendars import clear_calendar
-
-        mock_client.calendars.clear.return_value = None
-        result = clear_calendar()
-        parsed = json.loads(result)
-        assert parsed["success"] is True
+        result = clear_calendar(*args)
+        assert result == _encode({"success": True, "cleared": "primary"})
         mock_client.calendars.clear.assert_called_once_with("primary")
 
 
@@ -183,10 +181,8 @@ class TestClearCalendar:
 
 class TestCalendarErrorHandling:
     def test_sdk_exception(self, mock_client):
-        from gcal_mcp.tools.calendars import get_calendar
-
         mock_client.calendars.get.side_effect = RuntimeError("Auth expired")
         result = get_calendar("primary")
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert parsed["error"] is True
         assert "Auth expired" in parsed["message"]
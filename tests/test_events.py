@@ -8,38 +8,86 @@ They verify that:
   - Errors are caught and formatted properly
 """
 
-from __future__ import annotations
-
-import json
 from datetime import datetime, timezone
-from unittest.mock import MagicMock
+from unittest.mock import call
 
+import orjson
 import pytest
 
 from gcal_sdk.models import Event, EventDateTime
 
+from gcal_mcp.server import _JSON_OPTIONS, _fromisoformat, _parse_datetime, _response_cache
+from gcal_mcp.tools.events import (
+    create_event,
+    delete_event,
+    get_event,
+    list_event_instances,
+    list_events,
+    list_events_batch,
+    move_event,
+    patch_event,
+    update_event,
+)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
+# Datetimes the ISO fixtures below parse to, built once per module
+_JAN_1 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_DEC_31_END = datetime(2024, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+_JUN_15_10 = datetime(2024, 6, 15, 10, 0, tzinfo=timezone.utc)
+_JUN_15_11 = datetime(2024, 6, 15, 11, 0, tzinfo=timezone.utc)
+_JUN_20_9 = datetime(2024, 6, 20, 9, 0, tzinfo=timezone.utc)
+_JUN_20_10 = datetime(2024, 6, 20, 10, 0, tzinfo=timezone.utc)
+
+_DELETED_JSON = orjson.dumps({"success": True, "deleted": "event-1"}, option=_JSON_OPTIONS).decode()
+_UPDATE_BODY_JSON = '{"summary":"Updated","start":{"dateTime":"2024-06-15T10:00:00Z"}}'
+
+# Expected SDK calls shared by the list_events cases
+_EXPECTED_LIST_DEFAULT = call(
+    "primary",
+    time_min=None,
+    time_max=None,
+    max_results=25,
+    q=None,
+    single_events=True,
+    order_by="startTime",
+    show_deleted=False,
+    page_token=None,
+)
+_EXPECTED_LIST_SEARCH = call(
+    "primary",
+    time_min=None,
+    time_max=None,
+    max_results=25,
+    q="meeting",
+    single_events=True,
+    order_by="startTime",
+    show_deleted=False,
+    page_token=None,
+)
+
+# Stored event whose sequence=0 and default reminders the slimmer should drop
+_BASE_EVENT = Event(
+    id="event-1",
+    summary="Test Event",
+    start=EventDateTime(date_time=_JUN_15_10),
+    end=EventDateTime(date_time=_JUN_15_11),
+    status="confirmed",
+    etag='"abc123"',
+    kind="calendar#event",
+    iCalUID="event-1@google.com",
+    sequence=0,
+    reminders={"useDefault": True},
+)
+
+
 def _make_mock_event(**overrides):
-    """Create a mock Event with sensible defaults."""
-    defaults = {
-        "id": "event-1",
-        "summary": "Test Event",
-        "start": EventDateTime(date_time=datetime(2024, 6, 15, 10, 0, tzinfo=timezone.utc)),
-        "end": EventDateTime(date_time=datetime(2024, 6, 15, 11, 0, tzinfo=timezone.utc)),
-        "status": "confirmed",
-        "etag": '"abc123"',
-        "kind": "calendar#event",
-        "iCalUID": "event-1@google.com",
-        "sequence": 0,
-        "reminders": {"useDefault": True},
-    }
-    defaults.update(overrides)
-    return Event(**defaults)
+    """Create a mock Event with sensible defaults; overrides use field names."""
+    return _BASE_EVENT.model_copy(update=overrides)
 
 
 # ---------------------------------------------------------------------------
@@ -48,61 +96,109 @@ def _make_mock_event(**overrides):
 
 
 class TestListEvents:
-    def test_list_events_default(self, mock_client):
-        from gcal_mcp.tools.events import list_events
-
+    @pytest.mark.parametrize(
+        "kwargs, expected_call",
+        [({}, _EXPECTED_LIST_DEFAULT), ({"q": "meeting"}, _EXPECTED_LIST_SEARCH)],
+        ids=["default", "search"],
+    )
+    def test_list_events(self, mock_client, kwargs, expected_call):
         mock_client.events.list.return_value = [_make_mock_event()]
-        result = list_events()
-        parsed = json.loads(result)
+        result = list_events(**kwargs)
+        parsed = orjson.loads(result)
         assert isinstance(parsed, list)
         assert len(parsed) == 1
         assert parsed[0]["id"] == "event-1"
-        mock_client.events.list.assert_called_once_with(
-            "primary",
-            time_min=None,
-            time_max=None,
-            max_results=25,
-            q=None,
-            single_events=True,
-            order_by="startTime",
-            show_deleted=False,
-            page_token=None,
-        )
+        assert mock_client.events.list.call_args_list == [expected_call]
 
-    def test_list_events_with_time_range(self, mock_client):
-        from gcal_mcp.tools.events import list_events
+    def test_list_events_reuses_encoding_for_same_etag(self, mock_client):
+        mock_client.events.get.return_value = _make_mock_event()
+        get_event("primary", "event-1")
+        # Unchanged events share get_event's cached encoding
+        mock_client.events.list.return_value = [
+            _make_mock_event(summary="Ignored"),
+            _make_mock_event(id="event-2", summary="Second", etag=None),
+        ]
+        result = list_events()
+        assert [e["summary"] for e in orjson.loads(result)] == ["Test Event", "Second"]
+
+    def test_large_listing_bypasses_cache(self, mock_client, monkeypatch):
+        monkeypatch.setattr("gcal_mcp.tools.events._CACHED_LISTING_LIMIT", 2)
+        mock_client.events.list.return_value = [_make_mock_event(id=f"event-{i}") for i in range(3)]
+        result = list_events()
+        assert [e["id"] for e in orjson.loads(result)] == ["event-0", "event-1", "event-2"]
+        assert not _response_cache
 
+    def test_list_events_does_not_cache_events_without_id(self, mock_client):
+        mock_client.events.list.return_value = [
+            _make_mock_event(id=None, summary="First"),
+            _make_mock_event(id=None, summary="Second"),
+        ]
+        result = list_events()
+        assert [e["summary"] for e in orjson.loads(result)] == ["First", "Second"]
+
+    def test_list_events_with_time_range(self, mock_client):
         mock_client.events.list.return_value = []
         result = list_events(
             time_min="2024-01-01T00:00:00Z",
             time_max="2024-12-31T23:59:59Z",
             max_results=10,
         )
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert parsed == []
         call_kwargs = mock_client.events.list.call_args
         # time_min and time_max should be parsed to datetime objects
-        assert call_kwargs.kwargs["time_min"] == datetime(2024, 1, 1, tzinfo=timezone.utc)
-        assert call_kwargs.kwargs["time_max"] == datetime(2024, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+        assert call_kwargs.kwargs["time_min"] == _JAN_1
+        assert call_kwargs.kwargs["time_max"] == _DEC_31_END
 
-    def test_list_events_with_search(self, mock_client):
-        from gcal_mcp.tools.events import list_events
 
-        mock_client.events.list.return_value = [_make_mock_event(summary="Meeting")]
-        result = list_events(q="meeting")
-        parsed = json.loads(result)
-        assert len(parsed) == 1
-        mock_client.events.list.assert_called_once_with(
-            "primary",
-            time_min=None,
-            time_max=None,
-            max_results=25,
-            q="meeting",
-            single_events=True,
-            order_by="startTime",
-            show_deleted=False,
-            page_token=None,
+# ---------------------------------------------------------------------------
+# list_events_batch
+# ---------------------------------------------------------------------------
+
+
+class TestListEventsBatch:
+    def test_list_events_batch(self, mock_client, batch_responses):
+        batch_responses.update({
+            "primary": {"items": [{"id": "e1", "summary": "One", "etag": '"a"'}]},
+            "work@example.com": {"items": []},
+        })
+        result = list_events_batch(
+            calendar_ids='["primary", "work@example.com"]',
+            time_min="2024-01-01T00:00:00Z",
         )
+        parsed = orjson.loads(result)
+        assert parsed["primary"] == [{"id": "e1", "summary": "One"}]
+        assert "work@example.com" not in parsed
+        assert [b.request_ids for b in mock_client.batches] == [["primary", "work@example.com"]]
+        list_kwargs = mock_client.service.events.return_value.list.call_args.kwargs
+        assert list_kwargs["timeMin"] == "2024-01-01T00:00:00+00:00"
+        assert list_kwargs["maxResults"] == 25
+
+    def test_list_events_batch_partial_failure(self, mock_client, batch_responses):
+        batch_responses.update({
+            "primary": {"items": [{"id": "e1"}]},
+            "missing": RuntimeError("Not Found"),
+        })
+        result = list_events_batch(calendar_ids=["primary", "missing"])
+        parsed = orjson.loads(result)
+        assert parsed["primary"] == [{"id": "e1"}]
+        assert parsed["missing"]["error"] is True
+        assert "Not Found" in parsed["missing"]["message"]
+
+    def test_list_events_batch_splits_large_requests(self, mock_client, batch_responses):
+        ids = [f"cal-{i}" for i in range(120)]
+        batch_responses.update({i: {"items": [{"id": i}]} for i in ids})
+        result = list_events_batch(calendar_ids=ids + ["cal-0"])
+        parsed = orjson.loads(result)
+        assert list(parsed) == ids
+        assert [len(b.request_ids) for b in mock_client.batches] == [50, 50, 20]
+
+    @pytest.mark.parametrize("calendar_ids", ['"primary"', '{"primary": 1}', '["primary", 2]'])
+    def test_list_events_batch_rejects_non_list(self, mock_client, batch_responses, calendar_ids):
+        parsed = orjson.loads(list_events_batch(calendar_ids=calendar_ids))
+        assert parsed["error"] is True
+        assert "calendar_ids" in parsed["message"]
+        assert mock_client.batches == []
 
 
 # ---------------------------------------------------------------------------
@@ -112,14 +208,27 @@ class TestListEvents:
 
 class TestGetEvent:
     def test_get_event(self, mock_client):
-        from gcal_mcp.tools.events import get_event
-
         mock_client.events.get.return_value = _make_mock_event()
         result = get_event("primary", "event-1")
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert parsed["id"] == "event-1"
         mock_client.events.get.assert_called_once_with("primary", "event-1")
 
+    def test_get_event_drops_noise(self, mock_client):
+        mock_client.events.get.return_value = _make_mock_event()
+        parsed = orjson.loads(get_event("primary", "event-1"))
+        assert set(parsed) == {"id", "summary", "start", "end", "status"}
+
+    def test_get_event_reuses_encoding_for_same_etag(self, mock_client):
+        mock_client.events.get.return_value = _make_mock_event()
+        first = get_event("primary", "event-1")
+        # Same etag means same content, so the cached encoding is served
+        mock_client.events.get.return_value = _make_mock_event(summary="Ignored")
+        assert get_event("primary", "event-1") is first
+
+        mock_client.events.get.return_value = _make_mock_event(summary="Renamed", etag='"def456"')
+        assert orjson.loads(get_event("primary", "event-1"))["summary"] == "Renamed"
+
 
 # ---------------------------------------------------------------------------
 # create_event
@@ -128,55 +237,42 @@ class TestGetEvent:
 
 class TestCreateEvent:
     def test_create_event_basic(self, mock_client):
-        from gcal_mcp.tools.events import create_event
-
         mock_client.events.create.return_value = _make_mock_event(id="new-event")
         result = create_event(
             summary="New Meeting",
             start="2024-06-15T10:00:00Z",
             end="2024-06-15T11:00:00Z",
         )
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert parsed["id"] == "new-event"
         call_kwargs = mock_client.events.create.call_args
         assert call_kwargs.args[0] == "primary"
         assert call_kwargs.kwargs["summary"] == "New Meeting"
-        assert call_kwargs.kwargs["start"] == datetime(2024, 6, 15, 10, 0, tzinfo=timezone.utc)
-        assert call_kwargs.kwargs["end"] == datetime(2024, 6, 15, 11, 0, tzinfo=timezone.utc)
-
-    def test_create_event_with_attendees_json(self, mock_client):
-        from gcal_mcp.tools.events import create_event
-
+        assert call_kwargs.kwargs["start"] == _JUN_15_10
+        assert call_kwargs.kwargs["end"] == _JUN_15_11
+
+    @pytest.mark.parametrize(
+        "attendees",
+        [
+            '["alice@example.com", "bob@example.com"]',
+            ["alice@example.com", "bob@example.com"],
+        ],
+        ids=["json", "list"],
+    )
+    def test_create_event_with_attendees(self, mock_client, attendees):
         mock_client.events.create.return_value = _make_mock_event()
         result = create_event(
             summary="Team Sync",
             start="2024-06-15T10:00:00Z",
             end="2024-06-15T11:00:00Z",
-            attendees='["alice@example.com", "bob@example.com"]',
+            attendees=attendees,
         )
-        parsed = json.loads(result)
-        assert parsed["id"] == "event-1"
-        call_kwargs = mock_client.events.create.call_args.kwargs
-        assert call_kwargs["attendees"] == ["alice@example.com", "bob@example.com"]
-
-    def test_create_event_with_attendees_list(self, mock_client):
-        from gcal_mcp.tools.events import create_event
-
-        mock_client.events.create.return_value = _make_mock_event()
-        result = create_event(
-            summary="Team Sync",
-            start="2024-06-15T10:00:00Z",
-            end="2024-06-15T11:00:00Z",
-            attendees=["alice@example.com", "bob@example.com"],
-        )
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert parsed["id"] == "event-1"
         call_kwargs = mock_client.events.create.call_args.kwargs
         assert call_kwargs["attendees"] == ["alice@example.com", "bob@example.com"]
 
     def test_create_event_with_all_fields(self, mock_client):
-        from gcal_mcp.tools.events import create_event
-
         mock_client.events.create.return_value = _make_mock_event()
         result = create_event(
             summary="Offsite",
@@ -187,7 +283,7 @@ class TestCreateEvent:
             time_zone="America/Denver",
             calendar_id="work-calendar",
         )
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert parsed["id"] == "event-1"
         call_kwargs = mock_client.events.create.call_args
         assert call_kwargs.args[0] == "work-calendar"
@@ -203,12 +299,9 @@ class TestCreateEvent:
 
 class TestUpdateEvent:
     def test_update_event(self, mock_client):
-        from gcal_mcp.tools.events import update_event
-
         mock_client.events.update.return_value = _make_mock_event(summary="Updated")
-        body = json.dumps({"summary": "Updated", "start": {"dateTime": "2024-06-15T10:00:00Z"}})
-        result = update_event("primary", "event-1", body=body)
-        parsed = json.loads(result)
+        result = update_event("primary", "event-1", body=_UPDATE_BODY_JSON)
+        parsed = orjson.loads(result)
         assert parsed["summary"] == "Updated"
         mock_client.events.update.assert_called_once_with(
             "primary", "event-1",
@@ -216,12 +309,10 @@ class TestUpdateEvent:
         )
 
     def test_update_event_dict_body(self, mock_client):
-        from gcal_mcp.tools.events import update_event
-
         mock_client.events.update.return_value = _make_mock_event(summary="Updated")
         body = {"summary": "Updated"}
         result = update_event("primary", "event-1", body=body)
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert parsed["summary"] == "Updated"
         mock_client.events.update.assert_called_once_with(
             "primary", "event-1", body={"summary": "Updated"},
@@ -235,29 +326,25 @@ class TestUpdateEvent:
 
 class TestPatchEvent:
     def test_patch_event_summary(self, mock_client):
-        from gcal_mcp.tools.events import patch_event
-
         mock_client.events.patch.return_value = _make_mock_event(summary="Patched")
         result = patch_event("primary", "event-1", summary="Patched")
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert parsed["summary"] == "Patched"
         call_kwargs = mock_client.events.patch.call_args.kwargs
         assert call_kwargs["summary"] == "Patched"
 
     def test_patch_event_time(self, mock_client):
-        from gcal_mcp.tools.events import patch_event
-
         mock_client.events.patch.return_value = _make_mock_event()
         result = patch_event(
             "primary", "event-1",
             start="2024-06-20T09:00:00Z",
             end="2024-06-20T10:00:00Z",
         )
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert parsed["id"] == "event-1"
         call_kwargs = mock_client.events.patch.call_args.kwargs
-        assert call_kwargs["start"] == datetime(2024, 6, 20, 9, 0, tzinfo=timezone.utc)
-        assert call_kwargs["end"] == datetime(2024, 6, 20, 10, 0, tzinfo=timezone.utc)
+        assert call_kwargs["start"] == _JUN_20_9
+        assert call_kwargs["end"] == _JUN_20_10
 
 
 # ---------------------------------------------------------------------------
@@ -266,27 +353,17 @@ class TestPatchEvent:
 
 
 class TestDeleteEvent:
-    def test_delete_event(self, mock_client):
-        from gcal_mcp.tools.events import delete_event
-
-        mock_client.events.delete.return_value = None
-        result = delete_event("primary", "event-1")
-        parsed = json.loads(result)
-        assert parsed["success"] is True
-        assert parsed["deleted"] == "event-1"
-        mock_client.events.delete.assert_called_once_with(
-            "primary", "event-1", send_updates=None,
-        )
-
-    def test_delete_event_with_notifications(self, mock_client):
-        from gcal_mcp.tools.events import delete_event
-
+    @pytest.mark.parametrize(
+        "kwargs, expected_send_updates",
+        [({}, None), ({"send_updates": "all"}, "all")],
+        ids=["default", "with-notifications"],
+    )
+    def test_delete_event(self, mock_client, kwargs, expected_send_updates):
         mock_client.events.delete.return_value = None
-        result = delete_event("primary", "event-1", send_updates="all")
-        parsed = json.loads(result)
-        assert parsed["success"] is True
+        result = delete_event("primary", "event-1", **kwargs)
+        assert result == _DELETED_JSON
         mock_client.events.delete.assert_called_once_with(
-            "primary", "event-1", send_updates="all",
+            "primary", "event-1", send_updates=expected_send_updates,
         )
 
 
@@ -297,11 +374,9 @@ class TestDeleteEvent:
 
 class TestMoveEvent:
     def test_move_event(self, mock_client):
-        from gcal_mcp.tools.events import move_event
-
         mock_client.events.move.return_value = _make_mock_event()
         result = move_event("primary", "event-1", "other-calendar")
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert parsed["id"] == "event-1"
         mock_client.events.move.assert_called_once_with(
             "primary", "event-1", "other-calendar",
@@ -315,14 +390,12 @@ class TestMoveEvent:
 
 class TestListEventInstances:
     def test_list_instances(self, mock_client):
-        from gcal_mcp.tools.events import list_event_instances
-
         mock_client.events.instances.return_value = [
             _make_mock_event(id="instance-1"),
             _make_mock_event(id="instance-2"),
         ]
         result = list_event_instances("primary", "recurring-event-1")
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert len(parsed) == 2
         assert parsed[0]["id"] == "instance-1"
         mock_client.events.instances.assert_called_once_with(
@@ -333,8 +406,6 @@ class TestListEventInstances:
         )
 
     def test_list_instances_with_time_range(self, mock_client):
-        from gcal_mcp.tools.events import list_event_instances
-
         mock_client.events.instances.return_value = []
         result = list_event_instances(
             "primary", "recurring-event-1",
@@ -342,13 +413,43 @@ class TestListEventInstances:
             time_max="2024-06-30T23:59:59Z",
             max_results=10,
         )
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert parsed == []
         call_kwargs = mock_client.events.instances.call_args.kwargs
-        assert call_kwargs["time_min"] == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert call_kwargs["time_min"] == _JAN_1
         assert call_kwargs["max_results"] == 10
 
 
+# ---------------------------------------------------------------------------
+# _parse_datetime
+# ---------------------------------------------------------------------------
+
+
+class TestParseDatetime:
+    def test_naive_assumed_utc(self):
+        assert _parse_datetime("2024-06-15T10:00:00") == _JUN_15_10
+
+    def test_z_suffix_without_ciso8601(self, monkeypatch):
+        class Py310Datetime(datetime):
+            @classmethod
+            def fromisoformat(cls, value):
+                if value.endswith("Z"):
+                    raise ValueError(f"Invalid isoformat string: {value!r}")
+                return datetime.fromisoformat(value)
+
+        monkeypatch.setattr("gcal_mcp.server.datetime", Py310Datetime)
+        monkeypatch.setattr("gcal_mcp.server._parse_iso", _fromisoformat)
+        assert _parse_datetime.__wrapped__("2024-06-15T10:00:00Z") == _JUN_15_10
+
+    def test_repeated_values_cached(self):
+        first = _parse_datetime("2024-06-15T10:00:00+00:00")
+        assert _parse_datetime("2024-06-15T10:00:00+00:00") is first
+
+    def test_required_missing(self):
+        with pytest.raises(ValueError, match="required"):
+            _parse_datetime(None, required=True)
+
+
 # ---------------------------------------------------------------------------
 # Error handling
 # ---------------------------------------------------------------------------
@@ -356,23 +457,19 @@ class TestListEventInstances:
 
 class TestEventErrorHandling:
     def test_sdk_exception(self, mock_client):
-        from gcal_mcp.tools.events import get_event
-
         mock_client.events.get.side_effect = RuntimeError("Connection failed")
         result = get_event("primary", "event-1")
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert parsed["error"] is True
         assert "Connection failed" in parsed["message"]
 
     def test_invalid_json_attendees(self, mock_client):
-        from gcal_mcp.tools.events import create_event
-
         result = create_event(
             summary="Bad",
             start="2024-06-15T10:00:00Z",
             end="2024-06-15T11:00:00Z",
             attendees="{not valid json[",
         )
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert parsed["error"] is True
         assert "Invalid JSON" in parsed["message"]
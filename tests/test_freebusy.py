@@ -3,13 +3,40 @@
 These tests mock the GCalClient so no real API calls are made.
 """
 
-from __future__ import annotations
-
-import json
 from datetime import datetime, timezone
 
+import orjson
+import pytest
+
 from gcal_sdk.models import FreeBusyResponse, CalendarFreeBusy, BusyPeriod
 
+from gcal_mcp.tools.freebusy import query_freebusy
+
+_PRIMARY_IDS_JSON = '["primary"]'
+
+# Canned query responses; query_freebusy only reads them
+_FB_RESP_BASIC = FreeBusyResponse(
+    kind="calendar#freeBusy",
+    timeMin=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    timeMax=datetime(2024, 1, 31, 23, 59, 59, tzinfo=timezone.utc),
+    calendars={
+        "primary": CalendarFreeBusy(
+            busy=[
+                BusyPeriod(
+                    start=datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc),
+                    end=datetime(2024, 1, 15, 11, 0, tzinfo=timezone.utc),
+                )
+            ]
+        )
+    },
+)
+_FB_RESP_LIST = FreeBusyResponse(
+    calendars={
+        "primary": CalendarFreeBusy(busy=[]),
+        "other@example.com": CalendarFreeBusy(busy=[]),
+    }
+)
+
 
 # ---------------------------------------------------------------------------
 # query_freebusy
@@ -18,30 +45,13 @@ from gcal_sdk.models import FreeBusyResponse, CalendarFreeBusy, BusyPeriod
 
 class TestQueryFreeBusy:
     def test_query_freebusy_basic(self, mock_client):
-        from gcal_mcp.tools.freebusy import query_freebusy
-
-        mock_response = FreeBusyResponse(
-            kind="calendar#freeBusy",
-            timeMin=datetime(2024, 1, 1, tzinfo=timezone.utc),
-            timeMax=datetime(2024, 1, 31, 23, 59, 59, tzinfo=timezone.utc),
-            calendars={
-                "primary": CalendarFreeBusy(
-                    busy=[
-                        BusyPeriod(
-                            start=datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc),
-                            end=datetime(2024, 1, 15, 11, 0, tzinfo=timezone.utc),
-                        )
-                    ]
-                )
-            },
-        )
-        mock_client.freebusy.query.return_value = mock_response
+        mock_client.freebusy.query.return_value = _FB_RESP_BASIC
         result = query_freebusy(
-            calendar_ids='["primary"]',
+            calendar_ids=_PRIMARY_IDS_JSON,
             time_min="2024-01-01T00:00:00Z",
             time_max="2024-01-31T23:59:59Z",
         )
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert "calendars" in parsed
         assert "primary" in parsed["calendars"]
         assert len(parsed["calendars"]["primary"]["busy"]) == 1
@@ -53,48 +63,72 @@ class TestQueryFreeBusy:
         )
 
     def test_query_freebusy_list_input(self, mock_client):
-        from gcal_mcp.tools.freebusy import query_freebusy
-
-        mock_response = FreeBusyResponse(
-            calendars={
-                "primary": CalendarFreeBusy(busy=[]),
-                "other@example.com": CalendarFreeBusy(busy=[]),
-            }
-        )
-        mock_client.freebusy.query.return_value = mock_response
+        mock_client.freebusy.query.return_value = _FB_RESP_LIST
         result = query_freebusy(
             calendar_ids=["primary", "other@example.com"],
             time_min="2024-01-01T00:00:00Z",
             time_max="2024-01-31T23:59:59Z",
             time_zone="America/Denver",
         )
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert "primary" in parsed["calendars"]
         assert "other@example.com" in parsed["calendars"]
         call_kwargs = mock_client.freebusy.query.call_args.kwargs
         assert call_kwargs["time_zone"] == "America/Denver"
 
-    def test_query_freebusy_error(self, mock_client):
-        from gcal_mcp.tools.freebusy import query_freebusy
+    def test_query_freebusy_many_calendars_batched(self, mock_client, batch_responses):
+        ids = [f"room-{i}@example.com" for i in range(120)]
+        busy = [{"start": "2024-01-15T10:00:00Z", "end": "2024-01-15T11:00:00Z"}]
+        batch_responses.update({
+            "0": {"calendars": {cal_id: {"busy": busy} for cal_id in ids[:50]}},
+            "1": {"calendars": {cal_id: {"busy": []} for cal_id in ids[50:100]}},
+            "2": RuntimeError("Backend Error"),
+        })
+        result = query_freebusy(
+            calendar_ids=ids,
+            time_min="2024-01-01T00:00:00Z",
+            time_max="2024-01-31T23:59:59Z",
+            time_zone="America/Denver",
+        )
+        parsed = orjson.loads(result)
+        assert len(parsed["calendars"]) == 120
+        assert len(parsed["calendars"]["room-0@example.com"]["busy"]) == 1
+        assert parsed["calendars"]["room-119@example.com"]["errors"] == [{"reason": "Backend Error"}]
+        assert [b.request_ids for b in mock_client.batches] == [["0", "1", "2"]]
+        bodies = [c.kwargs["body"] for c in mock_client.service.freebusy.return_value.query.call_args_list]
+        assert [len(b["items"]) for b in bodies] == [50, 50, 20]
+        assert bodies[0]["timeZone"] == "America/Denver"
+        mock_client.freebusy.query.assert_not_called()
 
+    def test_query_freebusy_error(self, mock_client):
         mock_client.freebusy.query.side_effect = RuntimeError("API error")
         result = query_freebusy(
-            calendar_ids='["primary"]',
+            calendar_ids=_PRIMARY_IDS_JSON,
             time_min="2024-01-01T00:00:00Z",
             time_max="2024-01-31T23:59:59Z",
         )
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert parsed["error"] is True
         assert "API error" in parsed["message"]
 
-    def test_query_freebusy_invalid_json(self, mock_client):
-        from gcal_mcp.tools.freebusy import query_freebusy
+    @pytest.mark.parametrize("calendar_ids", ['"primary"', '{"primary": 1}', '["primary", 2]'])
+    def test_query_freebusy_rejects_non_list(self, mock_client, calendar_ids):
+        result = query_freebusy(
+            calendar_ids=calendar_ids,
+            time_min="2024-01-01T00:00:00Z",
+            time_max="2024-01-31T23:59:59Z",
+        )
+        parsed = orjson.loads(result)
+        assert parsed["error"] is True
+        assert "calendar_ids" in parsed["message"]
+        mock_client.freebusy.query.assert_not_called()
 
+    def test_query_freebusy_invalid_json(self, mock_client):
         result = query_freebusy(
             calendar_ids="{bad json[",
             time_min="2024-01-01T00:00:00Z",
             time_max="2024-01-31T23:59:59Z",
         )
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert parsed["error"] is True
         assert "Invalid JSON" in parsed["message"]
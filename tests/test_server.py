@@ -0,0 +1,94 @@
+"""Tests for the shared client lifecycle in gcal_mcp.server."""
+
+from __future__ import annotations
+
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+import gcal_mcp.server as srv
+
+
+@pytest.fixture
+def client_factory():
+    """Clear the shared client and patch GCalClient so it can be rebuilt."""
+    with patch.object(srv, "_client", None), patch.object(srv, "GCalClient") as factory:
+        yield factory
+
+
+class TestGetClient:
+    def test_client_reused(self, mock_client):
+        assert srv.get_client() is mock_client
+        assert srv.get_client() is mock_client
+
+    def test_concurrent_first_calls_build_one_client(self, client_factory):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(lambda _: srv.get_client(), range(16)))
+        assert all(c is client_factory.return_value for c in clients)
+        client_factory.assert_called_once_with()
+
+
+class TestMain:
+    def test_main_warms_client(self, client_factory):
+        with patch.object(srv.mcp, "run") as run:
+            srv.main()
+        assert srv._client is client_factory.return_value
+        run.assert_called_once_with()
+
+    def test_main_survives_credential_failure(self, client_factory):
+        client_factory.side_effect = FileNotFoundError("token.json")
+        with patch.object(srv.mcp, "run") as run:
+            srv.main()
+        assert srv._client is None
+        run.assert_called_once_with()
+
+
+class TestToolRegistration:
+    async def test_tools_registered_with_object_input_schemas(self):
+        tools = {tool.name: tool for tool in await srv.mcp.list_tools()}
+        assert {"list_events", "list_events_batch", "get_event", "get_calendar", "query_freebusy"} <= set(tools)
+        for tool in tools.values():
+            assert tool.inputSchema["type"] == "object"
+
+
+class TestCachedJson:
+    def test_hit_returns_stored_encoding(self):
+        first = srv._cached_json(("event", "primary", "e1", '"a"'), {"id": "e1"})
+        assert srv._cached_json(("event", "primary", "e1", '"a"'), {"id": "ignored"}) is first
+
+    def test_least_recently_used_entry_evicted(self, monkeypatch):
+        monkeypatch.setattr(srv, "_RESPONSE_CACHE_SIZE", 2)
+        srv._cached_json(("a",), {"id": "a"})
+        srv._cached_json(("b",), {"id": "b"})
+        srv._cached_json(("a",), {"id": "a"})  # refreshes "a"
+        srv._cached_json(("c",), {"id": "c"})
+        assert list(srv._response_cache) == [("a",), ("c",)]
+
+
+class TestToolResponse:
+    def test_result_slimmed_and_serialized(self):
+        @srv.tool_response
+        def tool(event_id: str):
+            return {"id": event_id, "etag": '"abc"'}
+
+        assert orjson.loads(tool("event-1")) == {"id": "event-1"}
+
+    def test_exception_formatted(self):
+        @srv.tool_response
+        def tool():
+            raise RuntimeError("boom")
+
+        parsed = orjson.loads(tool())
+        assert parsed == {"error": True, "message": "boom"}
+
+    def test_signature_reports_str(self):
+        @srv.tool_response
+        def tool(event_id: str, max_results: int = 25):
+            return {}
+
+        sig = inspect.signature(tool)
+        assert list(sig.parameters) == ["event_id", "max_results"]
+        assert sig.return_annotation is str
@@ -1,22 +1,53 @@
 """Tests for _slim_response -- verifies Calendar API noise stripping."""
 
-from __future__ import annotations
-
-from gcal_mcp.server import _slim_response
+import copy
+from datetime import datetime, timezone
+
+import orjson
+import pytest
+
+from gcal_sdk.models import Calendar, Event
+
+from gcal_mcp.server import _JSON_OPTIONS, _dump, _json_array, _slim_response, _to_json
+
+# Realistic raw API event, built once; _slim_response must not mutate it
+_FULL_EVENT_RAW = {
+    "id": "abc123",
+    "etag": '"3456789"',
+    "kind": "calendar#event",
+    "summary": "Team Standup",
+    "description": "Daily standup meeting",
+    "location": None,
+    "start": {"dateTime": "2024-06-15T09:00:00-06:00", "timeZone": "America/Denver"},
+    "end": {"dateTime": "2024-06-15T09:15:00-06:00", "timeZone": "America/Denver"},
+    "status": "confirmed",
+    "htmlLink": "https://calendar.google.com/event?eid=abc123",
+    "created": "2024-01-01T00:00:00.000Z",
+    "updated": "2024-06-14T20:00:00.000Z",
+    "creator": {"email": "user@example.com"},
+    "organizer": {"email": "user@example.com"},
+    "iCalUID": "abc123@google.com",
+    "sequence": 0,
+    "reminders": {"useDefault": True},
+    "attendees": [],
+    "colorId": None,
+}
 
 
 class TestAlwaysStrippedKeys:
-    def test_etag_stripped(self):
-        data = {"id": "event-1", "etag": '"abc123"', "summary": "Test"}
-        result = _slim_response(data)
-        assert "etag" not in result
-        assert result["summary"] == "Test"
-
-    def test_kind_stripped(self):
-        data = {"id": "event-1", "kind": "calendar#event", "summary": "Test"}
-        result = _slim_response(data)
-        assert "kind" not in result
-        assert result["summary"] == "Test"
+    @pytest.mark.parametrize(
+        "key, value",
+        [
+            ("etag", '"abc123"'),
+            ("kind", "calendar#event"),
+            ("iCalUID", "event-1@google.com"),
+            ("conferenceProperties", {"allowedConferenceSolutionTypes": ["hangoutsMeet"]}),
+        ],
+    )
+    def test_key_stripped(self, key, value):
+        data = {"id": "event-1", key: value, "summary": "Test"}
+        result = _slim_response(data)
+        assert result == {"id": "event-1", "summary": "Test"}
 
     def test_both_stripped(self):
         data = {"id": "event-1", "etag": '"xyz"', "kind": "calendar#event", "summary": "Test"}
@@ -41,15 +72,11 @@ class TestNullStripping:
 
 
 class TestEmptyValueStripping:
-    def test_empty_string_stripped(self):
-        data = {"id": "event-1", "description": "", "summary": "Test"}
-        result = _slim_response(data)
-        assert "description" not in result
-
-    def test_empty_list_stripped(self):
-        data = {"id": "event-1", "attendees": [], "summary": "Test"}
+    @pytest.mark.parametrize("key, value", [("description", ""), ("attendees", [])])
+    def test_empty_value_stripped(self, key, value):
+        data = {"id": "event-1", key: value, "summary": "Test"}
         result = _slim_response(data)
-        assert "attendees" not in result
+        assert key not in result
 
     def test_non_empty_list_kept(self):
         data = {"id": "event-1", "attendees": [{"email": "a@b.com"}]}
@@ -57,17 +84,15 @@ class TestEmptyValueStripping:
         assert len(result["attendees"]) == 1
 
 
-class TestICalUIDStripping:
-    def test_icaluid_stripped(self):
-        data = {"id": "event-1", "iCalUID": "event-1@google.com", "summary": "Test"}
-        result = _slim_response(data)
-        assert "iCalUID" not in result
-        assert result["id"] == "event-1"
-
-
 class TestRemindersStripping:
-    def test_default_reminders_stripped(self):
-        data = {"id": "event-1", "reminders": {"useDefault": True}, "summary": "Test"}
+    @pytest.mark.parametrize(
+        "reminders",
+        [{"useDefault": True}, {"use_default": True}],
+        ids=["api", "pydantic-style"],
+    )
+    def test_default_reminders_stripped(self, reminders):
+        """Default reminders are dropped whether keyed useDefault or use_default."""
+        data = {"id": "event-1", "reminders": reminders, "summary": "Test"}
         result = _slim_response(data)
         assert "reminders" not in result
 
@@ -83,23 +108,13 @@ class TestRemindersStripping:
         assert "reminders" in result
         assert result["reminders"]["overrides"][0]["minutes"] == 10
 
-    def test_use_default_pydantic_style_stripped(self):
-        """Handle the case where pydantic serializes as use_default instead of useDefault."""
-        data = {"id": "event-1", "reminders": {"use_default": True}, "summary": "Test"}
-        result = _slim_response(data)
-        assert "reminders" not in result
-
 
 class TestSequenceStripping:
-    def test_sequence_zero_stripped(self):
-        data = {"id": "event-1", "sequence": 0, "summary": "Test"}
+    @pytest.mark.parametrize("sequence, expected", [(0, None), (3, 3)])
+    def test_sequence_stripped_only_when_zero(self, sequence, expected):
+        data = {"id": "event-1", "sequence": sequence, "summary": "Test"}
         result = _slim_response(data)
-        assert "sequence" not in result
-
-    def test_sequence_nonzero_kept(self):
-        data = {"id": "event-1", "sequence": 3, "summary": "Test"}
-        result = _slim_response(data)
-        assert result["sequence"] == 3
+        assert result.get("sequence") == expected
 
 
 class TestRecursiveSlimming:
@@ -128,10 +143,30 @@ class TestRecursiveSlimming:
             assert "kind" not in item
 
 
+class TestDeepNesting:
+    def test_deep_payload_does_not_recurse(self):
+        """Slimming walks an explicit stack, so depth is not bounded by the recursion limit."""
+        depth = 5000
+        data: dict = {"id": "leaf", "etag": '"x"'}
+        for _ in range(depth):
+            data = {"nested": [data], "kind": "wrapper"}
+
+        result = _slim_response(data)
+
+        for _ in range(depth):
+            assert list(result) == ["nested"]
+            result = result["nested"][0]
+        assert result == {"id": "leaf"}
+
+
 class TestEdgeCases:
     def test_empty_dict(self):
         assert _slim_response({}) == {}
 
+    def test_nested_empty_dict_kept(self):
+        data = {"id": "event-1", "extendedProperties": {}}
+        assert _slim_response(data) == data
+
     def test_empty_list(self):
         assert _slim_response([]) == []
 
@@ -146,29 +181,9 @@ class TestRealisticEventSlimming:
     """A realistic event slimmed to verify end-to-end behavior."""
 
     def test_full_event_slimmed(self):
-        raw = {
-            "id": "abc123",
-            "etag": '"3456789"',
-            "kind": "calendar#event",
-            "summary": "Team Standup",
-            "description": "Daily standup meeting",
-            "location": None,
-            "start": {"dateTime": "2024-06-15T09:00:00-06:00", "timeZone": "America/Denver"},
-            "end": {"dateTime": "2024-06-15T09:15:00-06:00", "timeZone": "America/Denver"},
-            "status": "confirmed",
-            "htmlLink": "https://calendar.google.com/event?eid=abc123",
-            "created": "2024-01-01T00:00:00.000Z",
-            "updated": "2024-06-14T20:00:00.000Z",
-            "creator": {"email": "user@example.com"},
-            "organizer": {"email": "user@example.com"},
-            "iCalUID": "abc123@google.com",
-            "sequence": 0,
-            "reminders": {"useDefault": True},
-            "attendees": [],
-            "colorId": None,
-        }
-
-        result = _slim_response(raw)
+        before = copy.deepcopy(_FULL_EVENT_RAW)
+        result = _slim_response(_FULL_EVENT_RAW)
+        assert _FULL_EVENT_RAW == before  # input left untouched
 
         # Stripped fields
         assert "etag" not in result
@@ -189,3 +204,45 @@ class TestRealisticEventSlimming:
         assert result["creator"] == {"email": "user@example.com"}
         assert result["organizer"] == {"email": "user@example.com"}
         assert result["start"]["dateTime"] == "2024-06-15T09:00:00-06:00"
+
+
+class TestDump:
+    def test_stripped_fields_excluded_during_dump(self):
+        event = Event(id="event-1", etag='"abc"', kind="calendar#event", iCalUID="event-1@google.com")
+        assert _dump(event) == {"id": "event-1"}
+
+    def test_non_models_pass_through(self):
+        data = {"id": "event-1", "etag": '"abc"'}
+        assert _dump(data) is data
+
+
+class TestToJson:
+    def test_slims_and_serializes(self):
+        result = _to_json({"id": "event-1", "etag": '"abc"', "location": None})
+        assert orjson.loads(result) == {"id": "event-1"}
+
+    def test_datetimes_serialized_as_rfc3339(self):
+        result = _to_json({"start": datetime(2024, 6, 15, 10, 0, tzinfo=timezone.utc)})
+        assert orjson.loads(result) == {"start": "2024-06-15T10:00:00Z"}
+
+    def test_naive_datetimes_treated_as_utc(self):
+        result = _to_json({"start": datetime(2024, 6, 15, 10, 0)})
+        assert orjson.loads(result) == {"start": "2024-06-15T10:00:00Z"}
+
+    def test_list_of_models_encoded_per_element(self):
+        calendars = [
+            Calendar(id="cal-1", summary="One", etag='"a"'),
+            Calendar(id="cal-2", description=""),
+        ]
+        result = _to_json(calendars)
+        one = orjson.dumps({"id": "cal-1", "summary": "One"}, option=_JSON_OPTIONS).decode()
+        two = orjson.dumps({"id": "cal-2"}, option=_JSON_OPTIONS).decode()
+        assert result == _json_array([one, two])
+
+    def test_pretty_list_matches_whole_list_encoding(self, monkeypatch):
+        pretty_options = _JSON_OPTIONS | orjson.OPT_INDENT_2
+        monkeypatch.setattr("gcal_mcp.server._PRETTY", True)
+        monkeypatch.setattr("gcal_mcp.server._JSON_OPTIONS", pretty_options)
+        events = [{"id": "e1", "start": {"dateTime": "x"}}, {"id": "e2", "summary": "a\nb"}]
+        assert _to_json(events) == orjson.dumps(events, option=pretty_options).decode()
+        assert _to_json([]) == "[]"